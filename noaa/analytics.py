@@ -0,0 +1,84 @@
+"""Vectorized analytics helpers for NOAA result columns.
+
+These functions operate on the raw columns exposed by the result
+classes (`result.values`, `result.times`), so they require numpy.
+When the optional numba package is installed, the kernels are JIT
+compiled to native loops; without it they run as plain Python over the
+arrays, which is correct but slow for very large inputs.
+"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba as _numba
+
+    def _njit(func):
+        return _numba.njit(cache=True)(func)
+except ImportError:
+    def _njit(func):
+        return func
+
+
+@_njit
+def rolling_extrema(values: np.ndarray,
+                    window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the rolling minimum and maximum of a value column.
+
+    Args:
+        values: A float64 array, e.g. `result.values`.
+        window: The number of samples per window; must be positive and
+            no larger than the input.
+
+    Returns:
+        Two float64 arrays of length `len(values) - window + 1`: the
+        minimum and the maximum of each window.
+    """
+    if window < 1 or window > values.shape[0]:
+        raise ValueError('window must be in [1, len(values)]')
+    count = values.shape[0] - window + 1
+    mins = np.empty(count, np.float64)
+    maxs = np.empty(count, np.float64)
+    for i in range(count):
+        lo = values[i]
+        hi = values[i]
+        for j in range(i + 1, i + window):
+            sample = values[j]
+            lo = min(lo, sample)
+            hi = max(hi, sample)
+        mins[i] = lo
+        maxs[i] = hi
+    return mins, maxs
+
+
+@_njit
+def high_low_indices(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the local maxima and minima of a value column.
+
+    A sample is a high when it exceeds its predecessor and is at least
+    its successor, and a low in the mirrored case; plateau interiors
+    and the endpoints are not reported.
+
+    Args:
+        values: A float64 array, e.g. `result.values`.
+
+    Returns:
+        Two int64 index arrays: the positions of the highs and of the
+        lows, each in ascending order.
+    """
+    count = values.shape[0]
+    highs = np.empty(count, np.int64)
+    lows = np.empty(count, np.int64)
+    num_highs = 0
+    num_lows = 0
+    for i in range(1, count - 1):
+        prev = values[i - 1]
+        cur = values[i]
+        nxt = values[i + 1]
+        if cur > prev and cur >= nxt:
+            highs[num_highs] = i
+            num_highs += 1
+        elif cur < prev and cur <= nxt:
+            lows[num_lows] = i
+            num_lows += 1
+    return highs[:num_highs].copy(), lows[:num_lows].copy()
@@ -0,0 +1,40 @@
+# pylint: disable=C0103
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from . import analytics  # noqa: E402  pylint: disable=C0413
+
+_WAVE = np.array([1.0, 2.0, 3.0, 2.0, 1.0, 0.5, 1.5, 2.5, 2.0], np.float64)
+
+
+class TestRollingExtrema:
+    def test_window(self):
+        mins, maxs = analytics.rolling_extrema(_WAVE, 3)
+        assert len(mins) == len(maxs) == 7
+        assert list(maxs[:3]) == [3.0, 3.0, 3.0]
+        assert list(mins[3:6]) == [0.5, 0.5, 0.5]
+
+    def test_window_of_one_is_identity(self):
+        mins, maxs = analytics.rolling_extrema(_WAVE, 1)
+        assert list(mins) == list(_WAVE)
+        assert list(maxs) == list(_WAVE)
+
+    def test_rejects_bad_window(self):
+        with pytest.raises(ValueError):
+            analytics.rolling_extrema(_WAVE, 0)
+        with pytest.raises(ValueError):
+            analytics.rolling_extrema(_WAVE, len(_WAVE) + 1)
+
+
+class TestHighLowIndices:
+    def test_wave(self):
+        highs, lows = analytics.high_low_indices(_WAVE)
+        assert list(highs) == [2, 7]
+        assert list(lows) == [5]
+
+    def test_monotonic_has_no_extrema(self):
+        highs, lows = analytics.high_low_indices(
+            np.arange(5, dtype=np.float64))
+        assert len(highs) == 0
+        assert len(lows) == 0
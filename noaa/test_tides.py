@@ -1,147 +1,334 @@
 # pylint: disable=C0103
+import collections
 import datetime
-from urllib import parse
+import functools
+import json
 
 import pytest
 
 from . import tides
 
+_D_20190101 = datetime.datetime(2019, 1, 1)
+_D_20190102 = datetime.datetime(2019, 1, 2)
+_D_20190415 = datetime.datetime(2019, 4, 15)
+_D_20190501 = datetime.datetime(2019, 5, 1)
+_D_20190502 = datetime.datetime(2019, 5, 2)
+_D_20191021 = datetime.datetime(2019, 10, 21)
+
+
+_PREDICTIONS_DATA = {
+    'predictions': [
+        {'t': '2019-05-01 04:20', 'v': '0.633', 'type': 'L'},
+        {'t': '2019-05-01 10:50', 'v': '4.453', 'type': 'H'},
+        {'t': '2019-05-01 16:41', 'v': '0.363', 'type': 'L'},
+        {'t': '2019-05-01 23:12', 'v': '4.776', 'type': 'H'},
+    ],
+}
+_ERROR_DATA = {
+    'error': {'message': 'No Predictions data was found. This product may '
+                         'not be offered at this station at the requested '
+                         'time.'},
+}
+_WATERLEVEL_ROW = {'t': '2019-05-07 18:24', 'v': '1.669', 's': '0.023',
+                   'f': '1,0,0,0', 'q': 'p'}
+_WATERLEVEL_DATA = {
+    'metadata': {'id': '8735180', 'name': 'Dauphin Island',
+                 'lat': '30.2500', 'lon': '-88.0750'},
+    'data': [_WATERLEVEL_ROW] * 2,
+}
+#: A flag field wider than the usual four entries, so decoding cannot
+#: take the fixed-offset fast path.
+_WIDE_FLAG_ROW = {'t': '2019-05-07 18:30', 'v': '1.671', 's': '0.021',
+                  'f': '0,1,0,0,1,0', 'q': 'v'}
+_WIDE_FLAG_DATA = {
+    'metadata': _WATERLEVEL_DATA['metadata'],
+    'data': [_WATERLEVEL_ROW, _WIDE_FLAG_ROW],
+}
+
+
+_WATERLEVEL_OVERRIDES = {
+    'station': 8735180,
+    'product': tides.Product.WATER_LEVEL,
+    'interval': None,
+    'begin_date': None,
+    'end_date': None,
+    'range': 1,
+}
+
+
+def _check_predictions(res):
+    assert len(res) == 4
+    assert res[0].type == 'L'
+    assert abs(res[1].value - 4.453) < 0.001
+    assert len(res.times) == len(res.values) == 4
+
+
+def _check_waterlevel(res):
+    assert len(res) == 2
+    assert abs(res[0].value - 1.669) < 0.001
+    assert len(res[0].flags) == 4
+    assert len(res.times) == len(res.values) == 2
+
+
+EXECUTE_CASES = [
+    ({}, _PREDICTIONS_DATA, _check_predictions),
+    (_WATERLEVEL_OVERRIDES, _WATERLEVEL_DATA, _check_waterlevel),
+]
+
+EXECUTE_IDS = [
+    'predictions',
+    'waterlevel',
+]
+
+
+def _make_req(**overrides):
+    """Build the canonical request, applying keyword overrides.
+
+    Overrides replace the default value passed to the builder method of
+    the same name; a value of None skips that builder call.
+    """
+    settings = {
+        'station': 8720211,
+        'product': tides.Product.PREDICTIONS,
+        'interval': tides.Interval.HILO,
+        'begin_date': _D_20190501,
+        'end_date': _D_20190502,
+        'units': tides.Unit.ENGLISH,
+        'datum': tides.Datum.MEAN_LOWER_LOW_WATER,
+        'timezone': tides.TimeZone.GMT,
+    }
+    settings.update(overrides)
+    req = tides.NoaaRequest()
+    for name, value in settings.items():
+        if value is not None:
+            getattr(req, name)(value)
+    return req
+
+
+@functools.lru_cache(maxsize=None)
+def _req_url_cached(override_items):
+    return str(_make_req(**dict(override_items)))
+
+
+def _req_url(**overrides):
+    """URL of the canonical request, built at most once per override set."""
+    return _req_url_cached(tuple(sorted(overrides.items())))
+
+
+class _FakeResp:
+    """Minimal stand-in for requests.Response serving a pre-built payload."""
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+        self.headers = {}
+
+    def json(self):
+        return self._data
+
+    @property
+    def content(self):
+        return json.dumps(self._data).encode()
+
+    @property
+    def text(self):
+        return json.dumps(self._data)
+
+
+def _counting_get(data):
+    """A requests.get replacement serving `data` for any URL.
+
+    Returns the list the replacement appends each requested URL to,
+    alongside the replacement itself.
+    """
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        return _FakeResp(data)
+    return calls, get
+
+
+def _fake_get(expected_url, data):
+    """A requests.get replacement serving `data` for `expected_url`."""
+    def get(url, **kwargs):
+        assert url == expected_url
+        return _FakeResp(data)
+    return get
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    """An empty response cache, isolated from the module-level one."""
+    cache = collections.OrderedDict()
+    monkeypatch.setattr(tides, '_RESPONSE_CACHE', cache)
+    return cache
+
+
+@pytest.fixture(scope='module')
+def base_req():
+    """Factory for the canonical request used throughout TestNoaaRequest."""
+    return _make_req
+
+
+@pytest.fixture(scope='session')
+def canonical_req():
+    """A single fully-built canonical request shared by read-only tests."""
+    return _make_req()
+
 
 class TestNoaaRequest:
-    def test_str(self):
-        req = tides.NoaaRequest()\
-            .station(8720211)\
-            .product(tides.Product.PREDICTIONS)\
-            .interval(tides.Interval.HILO)\
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01'))\
-            .end_date(datetime.datetime.fromisoformat('2019-05-02'))\
-            .units(tides.Unit.ENGLISH)\
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER)\
-            .timezone(tides.TimeZone.GMT)
-        query = parse.parse_qs(parse.urlparse(str(req)).query)
-        assert query['product'] == ['predictions']
-        assert query['station'] == ['8720211']
-        assert query['interval'] == ['hilo']
-        assert query['begin_date'] == ['20190501 00:00']
-        assert query['end_date'] == ['20190502 00:00']
-        assert query['units'] == ['english']
-        assert query['datum'] == ['MLLW']
-        assert query['time_zone'] == ['gmt']
-
-    def test_str_no_interval(self):
-        req = tides.NoaaRequest()\
-            .station(8720211)\
-            .product(tides.Product.PREDICTIONS)\
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01'))\
-            .end_date(datetime.datetime.fromisoformat('2019-05-02'))\
-            .units(tides.Unit.ENGLISH)\
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER)\
-            .timezone(tides.TimeZone.GMT)
-        query = parse.parse_qs(parse.urlparse(str(req)).query)
-        assert query['product'] == ['predictions']
-        assert query['station'] == ['8720211']
-        assert query['begin_date'] == ['20190501 00:00']
-        assert query['end_date'] == ['20190502 00:00']
-        assert query['units'] == ['english']
-        assert query['datum'] == ['MLLW']
-        assert query['time_zone'] == ['gmt']
-        assert 'interval' not in query
-
-    def test_ready(self):
-        req = tides.NoaaRequest()\
-            .station(8720211)\
-            .product(tides.Product.PREDICTIONS)\
-            .interval(tides.Interval.HILO)\
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01'))\
-            .end_date(datetime.datetime.fromisoformat('2019-05-02'))\
-            .units(tides.Unit.ENGLISH)\
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER)
+    def test_str(self, canonical_req):
+        assert str(canonical_req) == (
+            'https://tidesandcurrents.noaa.gov/api/datagetter?'
+            'application=noaa_py&format=json'
+            '&begin_date=20190501+00%3A00&end_date=20190502+00%3A00'
+            '&product=predictions&datum=MLLW&units=english'
+            '&time_zone=gmt&interval=hilo&station=8720211')
+
+    def test_str_no_interval(self, base_req):
+        req = base_req(interval=None)
+        assert str(req) == (
+            'https://tidesandcurrents.noaa.gov/api/datagetter?'
+            'application=noaa_py&format=json'
+            '&begin_date=20190501+00%3A00&end_date=20190502+00%3A00'
+            '&product=predictions&datum=MLLW&units=english'
+            '&time_zone=gmt&station=8720211')
+
+    def test_compile_template(self, base_req):
+        build = base_req().compile_template('station')
+        assert build(station=8720211) == _req_url()
+
+    def test_compile_template_unset_varying(self, base_req):
+        build = base_req(station=None).compile_template('station')
+        assert build(station=8720211) == _req_url()
+
+    def test_freeze(self, base_req):
+        url_for = base_req().freeze()
+        assert url_for(_D_20190501, _D_20190502) == _req_url()
+
+    def test_freeze_not_ready(self, base_req):
+        with pytest.raises(tides.ApiError):
+            base_req(product=None).freeze()
+
+    @pytest.mark.parametrize('overrides',
+                             [{}, {'end_date': None, 'range': 30}],
+                             ids=['endDate', 'range'])
+    def test_ready(self, base_req, overrides):
+        req = base_req(timezone=None, **overrides)
         assert not req._ready()
         with pytest.raises(tides.ApiError):
-            assert not req._ready(error=True)
+            req._ready(error=True)
 
         req.timezone(tides.TimeZone.GMT)
         assert req._ready()
 
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .range(30) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER)\
-            .timezone(tides.TimeZone.GMT)
-        assert req._ready()
-
-    def test_execute_predictions_request(self, requests_mock):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
-        requests_mock.get(
-            str(req),
-            text='{ "predictions" : '
-                 '[ {"t":"2019-05-01 04:20", "v":"0.633", "type":"L"},'
-                 '{"t":"2019-05-01 10:50", "v":"4.453", "type":"H"},'
-                 '{"t":"2019-05-01 16:41", "v":"0.363", "type":"L"},'
-                 '{"t":"2019-05-01 23:12", "v":"4.776", "type":"H"} ]}')
+    @pytest.mark.parametrize('overrides, data, check', EXECUTE_CASES,
+                             ids=EXECUTE_IDS)
+    def test_execute(self, base_req, monkeypatch, overrides, data, check):
+        req = base_req(**overrides)
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(**overrides), data))
+        check(req.execute())
+
+    def test_execute_iter(self, base_req, monkeypatch):
+        req = base_req()
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(), _PREDICTIONS_DATA))
+        rows = list(req.execute_iter())
+        assert len(rows) == 4
+        assert rows[0].type == 'L'
+
+    def test_execute_iter_waterlevel(self, base_req, monkeypatch):
+        req = base_req(**_WATERLEVEL_OVERRIDES)
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(**_WATERLEVEL_OVERRIDES),
+                                      _WATERLEVEL_DATA))
+        rows = list(req.execute_iter())
+        assert len(rows) == 2
+        assert rows[0].time == datetime.datetime(2019, 5, 7, 18, 24)
+        assert abs(rows[0].stdev - 0.023) < 0.001
+        assert rows[0].flags == [True, False, False, False]
+        assert rows[0].quality == 'p'
+
+    def test_execute_waterlevel_without_numpy(self, base_req, monkeypatch):
+        # Force the lazy row-decode path that CI otherwise never takes
+        # with numpy installed, with one row per flag-parse branch.
+        monkeypatch.setattr(tides, '_np', None)
+        req = base_req(**_WATERLEVEL_OVERRIDES)
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(**_WATERLEVEL_OVERRIDES),
+                                      _WIDE_FLAG_DATA))
         res = req.execute()
-        assert len(res) == 4
+        assert len(res) == 2
+        assert res[0].flags == [True, False, False, False]
+        assert res[1].flags == [False, True, False, False, True, False]
+        assert res.times == [datetime.datetime(2019, 5, 7, 18, 24),
+                             datetime.datetime(2019, 5, 7, 18, 30)]
+        assert abs(res.values[1] - 1.671) < 0.001
+        assert res[0] is res[0]  # decoded rows are memoized
+
+    def test_execute_iter_bad_request(self, canonical_req, monkeypatch):
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(), _ERROR_DATA))
+        with pytest.raises(tides.ApiError):
+            list(canonical_req.execute_iter())
+
+    def test_background_refresh_serves_warm_result(self, base_req,
+                                                    monkeypatch):
+        req = base_req()
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(), _PREDICTIONS_DATA))
+        req.enable_background_refresh(interval=60)
+        try:
+            first = req.execute()
+
+            def boom(url, **kwargs):
+                raise AssertionError('warm result should be served')
+            monkeypatch.setattr(tides._get_session(), 'get', boom)
+            assert req.execute() is first
+        finally:
+            # Stop the daemon thread before the monkeypatch unwinds,
+            # or it would keep polling the real endpoint.
+            req.disable_background_refresh()
+        assert req._refresh_thread is None
+
+    def test_execute_split(self, base_req, monkeypatch):
+        req = base_req(end_date=_D_20191021)
+
+        def get(url, **kwargs):
+            assert 'begin_date=' in url and 'end_date=' in url
+            return _FakeResp(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        res = req.execute_split(max_days=31)
+        # 173 days split into 31-day windows -> 6 windows of 4 rows.
+        assert len(res) == 24
         assert res[0].type == 'L'
-        assert abs(res[1].value - 4.453) < 0.001
-
-    def test_execute_bad_request(self, requests_mock):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
-        requests_mock.get(
-            str(req),
-            text='{"error": {"message":"No Predictions data was found. This '
-                 'product may not be offered at this station at the requested '
-                 'time."}} ')
+        assert len(res.values) == 24
+
+    def test_execute_split_absorbs_tail_minute(self, base_req, monkeypatch):
+        # A range of exactly one window plus one minute must not drop
+        # the closing sample: the single window stretches to the end.
+        req = base_req(begin_date=_D_20190101,
+                       end_date=datetime.datetime(2019, 2, 1, 0, 1))
+        calls, get = _counting_get(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        res = req.execute_split(max_days=31)
+        assert len(calls) == 1
+        assert 'end_date=20190201+00%3A01' in calls[0]
+        assert len(res) == 4
+
+    def test_execute_split_requires_range(self, base_req):
+        req = base_req(begin_date=None, end_date=None, range=24)
         with pytest.raises(tides.ApiError):
-            res = req.execute()
-
-    def test_execute_waterlevel_request(self, requests_mock):
-        req = tides.NoaaRequest() \
-            .station(8735180) \
-            .product(tides.Product.WATER_LEVEL) \
-            .range(1) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
-        requests_mock.get(
-            str(req),
-            text='{"metadata":{"id":"8735180","name":"Dauphin Island",'
-                 '"lat":"30.2500","lon":"-88.0750"}, "data": [{'
-                 '"t":"2019-05-07 18:24", "v":"1.669", "s":"0.023", "f":"0,0,'
-                 '0,0", "q":"p"},{"t":"2019-05-07 18:30", "v":"1.674", '
-                 '"s":"0.023", "f":"0,0,0,0", "q":"p"},{"t":"2019-05-07 '
-                 '18:36", "v":"1.674", "s":"0.033", "f":"0,0,0,0", "q":"p"},'
-                 '{"t":"2019-05-07 18:42", "v":"1.655", "s":"0.030", "f":"1,'
-                 '0,0,0", "q":"p"},{"t":"2019-05-07 18:48", "v":"1.574", '
-                 '"s":"0.026", "f":"1,0,0,0", "q":"p"},{"t":"2019-05-07 '
-                 '18:54", "v":"1.564", "s":"0.033", "f":"1,0,0,0", "q":"p"},'
-                 '{"t":"2019-05-07 19:00", "v":"1.502", "s":"0.026", "f":"1,'
-                 '0,0,0", "q":"p"},{"t":"2019-05-07 19:06", "v":"1.483", '
-                 '"s":"0.030", "f":"1,0,0,0", "q":"p"},{"t":"2019-05-07 '
-                 '19:12", "v":"1.459", "s":"0.026", "f":"1,0,0,0", "q":"p"}]}')
-        res = req.execute()
-        assert len(res) == 9
-        assert abs(res[0].value - 1.669) < 0.001
-        assert len(res[0].flags) == 4
+            req.execute_split()
+
+    def test_execute_bad_request(self, canonical_req, monkeypatch):
+        req = canonical_req
+        monkeypatch.setattr(tides._get_session(), 'get',
+                            _fake_get(_req_url(), _ERROR_DATA))
+        with pytest.raises(tides.ApiError):
+            req.execute()
 
     def test_str_enum(self):
         req = tides.NoaaRequest()
@@ -170,173 +357,186 @@ class TestNoaaRequest:
         with pytest.raises(ValueError):
             req.interval('foo')
 
-    def test_ready_bad_time(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
+    def test_station_bad_id(self):
+        with pytest.raises(ValueError):
+            tides.NoaaRequest().station('foo')
+
+    def test_ready_bad_time(self, base_req):
+        req = base_req(begin_date=None, end_date=None)
 
         req.date(tides.NoaaDate.TODAY)
         req.begin_date(datetime.datetime.now())
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
-    def test_ready_no_station(self):
-        req = tides.NoaaRequest() \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
+    def test_ready_no_station(self, base_req):
+        req = base_req(station=None)
 
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
-    def test_ready_no_product(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
+    def test_ready_no_product(self, base_req):
+        req = base_req(product=None)
 
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
-    def test_ready_no_interval(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
+    def test_ready_no_interval(self, base_req):
+        req = base_req(interval=None)
 
         # Interval is not a required argument.
         assert req._ready(error=True)
 
-    def test_ready_no_units(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER) \
-            .timezone(tides.TimeZone.GMT)
+    def test_ready_no_units(self, base_req):
+        req = base_req(units=None)
 
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
-    def test_ready_no_datum(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .timezone(tides.TimeZone.GMT)
+    def test_ready_no_datum(self, base_req):
+        req = base_req(datum=None)
 
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
-    def test_ready_no_timezone(self):
-        req = tides.NoaaRequest() \
-            .station(8720211) \
-            .product(tides.Product.PREDICTIONS) \
-            .interval(tides.Interval.HILO) \
-            .begin_date(datetime.datetime.fromisoformat('2019-05-01')) \
-            .end_date(datetime.datetime.fromisoformat('2019-05-02')) \
-            .units(tides.Unit.ENGLISH) \
-            .datum(tides.Datum.MEAN_LOWER_LOW_WATER)
+    def test_ready_no_timezone(self, base_req):
+        req = base_req(timezone=None)
 
         with pytest.raises(tides.ApiError):
             req._ready(error=True)
 
 
+class TestResponseCache:
+    def test_hit_skips_refetch(self, base_req, monkeypatch, response_cache):
+        req = base_req()
+        calls, get = _counting_get(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        first = req.execute(cache_ttl=300)
+        assert req.execute(cache_ttl=300) is first
+        assert len(calls) == 1
+
+    def test_expired_entry_refetches(self, base_req, monkeypatch,
+                                     response_cache):
+        req = base_req()
+        calls, get = _counting_get(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        req.execute(cache_ttl=300)
+        now = tides.time.monotonic()
+        monkeypatch.setattr(tides.time, 'monotonic', lambda: now + 301)
+        req.execute(cache_ttl=300)
+        assert len(calls) == 2
+
+    def test_lru_eviction(self, base_req, monkeypatch, response_cache):
+        monkeypatch.setattr(tides, '_RESPONSE_CACHE_SIZE', 1)
+        calls, get = _counting_get(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        first = base_req()
+        second = base_req(station=8735180)
+        first.execute(cache_ttl=300)
+        second.execute(cache_ttl=300)
+        # first's entry was evicted to make room for second's.
+        first.execute(cache_ttl=300)
+        assert len(calls) == 3
+
+    def test_clear_cache_substring(self, base_req, monkeypatch,
+                                   response_cache):
+        req = base_req()
+        calls, get = _counting_get(_PREDICTIONS_DATA)
+        monkeypatch.setattr(tides._get_session(), 'get', get)
+        req.execute(cache_ttl=300)
+        tides.clear_cache('station=9999999')
+        req.execute(cache_ttl=300)
+        assert len(calls) == 1
+        tides.clear_cache('station=8720211')
+        req.execute(cache_ttl=300)
+        assert len(calls) == 2
+
+    def test_auto_ttl(self, base_req):
+        # The canonical range ended in 2019; that data is immutable.
+        assert base_req()._cache_ttl() == float('inf')
+        latest = base_req(begin_date=None, end_date=None,
+                          date=tides.NoaaDate.LATEST)
+        assert latest._cache_ttl() == 60.0
+        now = datetime.datetime.now()
+        recent = base_req(begin_date=now - datetime.timedelta(days=2),
+                          end_date=now - datetime.timedelta(days=1))
+        assert recent._cache_ttl() == 3600.0
+
+
+def _mk_range(**attrs):
+    """Build a NoaaTimeRange with the given attributes set."""
+    time_range = tides.NoaaTimeRange()
+    for name, value in attrs.items():
+        setattr(time_range, name, value)
+    return time_range
+
+
+IS_VALID_CASES = [
+    ({'begin': _D_20190415,
+      'end': _D_20191021},
+     True),
+    ({'begin': _D_20190415,
+      'hours': 10},
+     True),
+    ({'end': _D_20191021,
+      'hours': 10},
+     True),
+    ({'date': tides.NoaaDate.RECENT}, True),
+    ({'date': tides.NoaaDate.TODAY}, True),
+    ({'date': tides.NoaaDate.LATEST}, True),
+    ({'date': 'foo'}, False),
+    ({'hours': 10}, True),
+    ({'hours': -10}, False),
+    ({'begin': _D_20190101,
+      'date': tides.NoaaDate.TODAY},
+     False),
+    ({'begin': _D_20190101,
+      'end': _D_20190102,
+      'hours': 32},
+     False),
+    ({'begin': _D_20190102,
+      'end': _D_20190101},
+     False),
+]
+
+IS_VALID_IDS = [
+    'beginAndEnd',
+    'beginAndRange',
+    'endAndRange',
+    'dateRecent',
+    'dateToday',
+    'dateLatest',
+    'dateInvalid',
+    'rangeOnly',
+    'rangeNegative',
+    'beginAndDate',
+    'tooManyFields',
+    'endBeforeStart',
+]
+
+STR_CASES = [
+    ({'begin': _D_20190415,
+      'end': _D_20191021},
+     'begin_date=20190415+00%3A00&end_date=20191021+00%3A00'),
+    ({'begin': _D_20190415,
+      'hours': 10},
+     'begin_date=20190415+00%3A00&range=10'),
+    ({'date': tides.NoaaDate.TODAY}, 'date=today'),
+]
+
+STR_IDS = [
+    'startAndEnd',
+    'startAndRange',
+    'date',
+]
+
+
 class TestNoaaTimeRange:
-    def test_is_valid_beginAndEnd(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-04-15')
-        time_range.end = datetime.datetime.fromisoformat('2019-10-21')
-        assert time_range.is_valid()
-
-    def test_is_valid_endpointAndRange(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-04-15')
-        time_range.hours = 10
-        assert time_range.is_valid()
-
-        time_range.begin = None
-        time_range.end = datetime.datetime.fromisoformat('2019-10-21')
-        assert time_range.is_valid()
-
-    def test_is_valid_date(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.date = tides.NoaaDate.RECENT
-        assert time_range.is_valid()
-
-        time_range.date = tides.NoaaDate.TODAY
-        assert time_range.is_valid()
-
-        time_range.date = tides.NoaaDate.LATEST
-        assert time_range.is_valid()
-
-        time_range.date = 'foo'
-        assert not time_range.is_valid()
-
-    def test_is_valid_rangeOnly(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.hours = 10
-        assert time_range.is_valid()
-
-        time_range.hours = -10
-        assert not time_range.is_valid()
-
-    def test_is_valid_tooManyFields(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-01-01')
-        time_range.date = tides.NoaaDate.TODAY
-        assert not time_range.is_valid()
-
-        time_range.date = None
-        time_range.end = datetime.datetime.fromisoformat('2019-01-02')
-        time_range.hours = 32
-        assert not time_range.is_valid()
-
-    def test_is_valid_endBeforeStart(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-01-02')
-        time_range.end = datetime.datetime.fromisoformat('2019-01-01')
-        assert not time_range.is_valid()
-
-    def test_str_startAndEnd(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-04-15')
-        time_range.end = datetime.datetime.fromisoformat('2019-10-21')
-
-        assert str(time_range) == 'begin_date=20190415 00:00&' \
-                                  'end_date=20191021 00:00'
-
-    def test_str_startAndRange(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.begin = datetime.datetime.fromisoformat('2019-04-15')
-        time_range.hours = 10
-
-        assert str(time_range) == 'begin_date=20190415 00:00&' \
-                                  'range=10'
-
-    def test_str_date(self):
-        time_range = tides.NoaaTimeRange()
-        time_range.date = tides.NoaaDate.TODAY
-
-        assert str(time_range) == 'date=today'
+    @pytest.mark.parametrize('attrs, expected', IS_VALID_CASES,
+                             ids=IS_VALID_IDS)
+    def test_is_valid(self, attrs, expected):
+        assert _mk_range(**attrs).is_valid() is expected
+
+    @pytest.mark.parametrize('attrs, expected', STR_CASES, ids=STR_IDS)
+    def test_str(self, attrs, expected):
+        assert str(_mk_range(**attrs)) == expected
@@ -1,11 +1,124 @@
 """The tides module defines exposes an API for the NOAA Tides and Currents API."""
+# pylint: disable=too-many-lines
 from typing import Mapping, Optional, List, Union
 
+import collections
+import concurrent.futures
 import datetime
 import enum
+import functools
+import threading
+import time
 import typing
-
-import requests
+import urllib.parse
+
+try:
+    import orjson
+    _loads = orjson.loads  # pylint: disable=no-member
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        import json
+        _loads = json.loads
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+try:
+    import ciso8601 as _ciso8601
+except ImportError:
+    _ciso8601 = None
+
+#: Shared session so that repeated requests reuse a pooled keep-alive
+#: connection instead of paying a fresh TCP and TLS handshake each
+#: time. Built on first use by _get_session() so that callers who only
+#: build URLs never pay the requests/urllib3/ssl import chain.
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared pooled session, constructing it on first use."""
+    global _SESSION  # pylint: disable=global-statement
+    if _SESSION is None:
+        # pylint: disable=import-outside-toplevel
+        import requests
+        import urllib3.response
+        session = requests.Session()
+        session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            # Retry-After is honored by default, so 429s back off as
+            # the server asks instead of hammering the rate limiter.
+            max_retries=requests.adapters.Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504))))
+        if getattr(urllib3.response, 'brotli', None) is not None:
+            # NOAA's JSON compresses far better under brotli than gzip;
+            # only advertise it when urllib3 itself loaded a brotli
+            # decoder (1.25+ with the codec installed) - merely having
+            # the codec importable is not enough for transparent
+            # decompression, and older urllib3 would hand the body
+            # through encoded.
+            session.headers['Accept-Encoding'] = 'br, gzip, deflate'
+        _SESSION = session
+    return _SESSION
+
+#: (connect, read) timeouts applied to every request, in seconds.
+_TIMEOUT = (5, 30)
+
+#: Responses larger than this many bytes are stream-parsed with ijson
+#: (when installed) rather than decoded in a single pass; below it the
+#: one-shot parser is faster.
+_STREAM_THRESHOLD = 1 << 20
+
+#: Least-recently-used cache of results keyed by request URL, used when
+#: a caller opts into caching via `NoaaRequest.execute(cache_ttl=...)`.
+_RESPONSE_CACHE = collections.OrderedDict()
+_RESPONSE_CACHE_SIZE = 128
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _cache_lookup(url, ttl):
+    """Return the cached result for `url` if it is younger than `ttl`."""
+    with _RESPONSE_CACHE_LOCK:
+        hit = _RESPONSE_CACHE.get(url)
+        if hit is None or time.monotonic() - hit[0] >= ttl:
+            return None
+        _RESPONSE_CACHE.move_to_end(url)
+        return hit[1]
+
+
+def _cache_store(url, result):
+    """Store `result` for `url`, evicting the least recently used."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[url] = (time.monotonic(), result)
+        _RESPONSE_CACHE.move_to_end(url)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+def clear_cache(url_substring: str = None) -> None:
+    """Drop cached results, or only those whose URL contains a substring.
+
+    Args:
+        url_substring: If given, only entries whose URL contains this
+            substring are removed; otherwise the whole cache is
+            cleared.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        if url_substring is None:
+            _RESPONSE_CACHE.clear()
+            return
+        for url in [u for u in _RESPONSE_CACHE if url_substring in u]:
+            del _RESPONSE_CACHE[url]
 
 
 class ApiError(Exception):
@@ -17,7 +130,7 @@ class ApiError(Exception):
     """
 
 
-class TimeZone(enum.Enum):
+class TimeZone(str, enum.Enum):
     """Enumeration of timezones available to the API.
 
     Returned data is time-stamped and those time stamps may be in one of the
@@ -35,7 +148,7 @@ class TimeZone(enum.Enum):
     LOCAL_DST = 'lst_ldt'
 
 
-class Interval(enum.Enum):
+class Interval(str, enum.Enum):
     """Enumeration of data intervals available to the API.
 
     By default, the API will return data for every six minutes.
@@ -49,7 +162,7 @@ class Interval(enum.Enum):
     HOUR = 'h'
 
 
-class Datum(enum.Enum):
+class Datum(str, enum.Enum):
     """Enumeration of NOAA water level data available to this API.
 
     A complete listing of valid data is available at the link below:
@@ -68,7 +181,7 @@ class Datum(enum.Enum):
     STATION = 'STND'
 
 
-class Product(enum.Enum):
+class Product(str, enum.Enum):
     """Enumeration of NOAA Products available to the Tides and Currents API.
 
     Full documentation is available at the link below:
@@ -94,7 +207,7 @@ class Product(enum.Enum):
     CURRENTS = 'currents'
 
 
-class Unit(enum.Enum):
+class Unit(str, enum.Enum):
     """Enumeration of the unit systems available to this API.
 
     ENGLISH will return data in feet, knots, and degrees fahrenheit.
@@ -104,7 +217,7 @@ class Unit(enum.Enum):
     METRIC = 'metric'
 
 
-class NoaaDate(enum.Enum):
+class NoaaDate(str, enum.Enum):
     """Magic number time range specifiers.
 
     TODAY refers to the 24-hour period beginning at the most recent midnight.
@@ -116,40 +229,261 @@ class NoaaDate(enum.Enum):
     RECENT = 'recent'
 
 
-class DataRow(typing.NamedTuple):
-    """A single data point from a standard NOAA data product."""
-    time: datetime.datetime
-    value: float
-    stdev: float
-    flags: List[bool]
-    quality: str
+#: Value-to-member tables for the string forms accepted by the builder
+#: setters. A dict probe avoids the metaclass value scan Enum.__call__
+#: performs on every string coercion.
+_PRODUCTS = {member.value: member for member in Product}
+_DATUMS = {member.value: member for member in Datum}
+_UNITS = {member.value: member for member in Unit}
+_INTERVALS = {member.value: member for member in Interval}
+_TIMEZONES = {member.value: member for member in TimeZone}
+_NOAA_DATES = {member.value: member for member in NoaaDate}
+
+#: Member-to-query-pair tables used when building URLs, so a rebuild
+#: costs one dict probe per parameter instead of a descriptor chain
+#: through Enum.value.
+_PRODUCT_PAIR = {member: ('product', member.value) for member in Product}
+_DATUM_PAIR = {member: ('datum', member.value) for member in Datum}
+_UNIT_PAIR = {member: ('units', member.value) for member in Unit}
+_TIMEZONE_PAIR = {member: ('time_zone', member.value) for member in TimeZone}
+_INTERVAL_PAIR = {member: ('interval', member.value) for member in Interval}
+
+
+def _to_member(table, value, enum_cls):
+    """Coerce a string value to an enum member via its value table.
+
+    Raises:
+        ValueError: if `value` is not the value of any member, matching
+            the behavior of calling the enum constructor directly.
+    """
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f'{value!r} is not a valid {enum_cls.__name__}') from None
+
+
+def _format_noaa_ts(moment: datetime.datetime) -> str:
+    """Format a datetime in NOAA's 'YYYYMMDD HH:MM' query format.
+
+    The format is fixed and locale-independent, so direct f-string
+    field formatting skips strftime's format parsing and locale
+    machinery on every URL build.
+    """
+    return (f'{moment.year:04d}{moment.month:02d}{moment.day:02d} '
+            f'{moment.hour:02d}:{moment.minute:02d}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_noaa_ts(stamp: str) -> datetime.datetime:
+    """Parse NOAA's fixed 'YYYY-MM-DD HH:MM' timestamp format.
+
+    The format never varies, so slicing the fixed-width fields avoids
+    strptime's per-call format parsing and locale machinery; when the
+    optional ciso8601 extension is installed its C parser is used
+    instead. Results are memoized because duplicate-minute stamps
+    recur across products and overlapping requests; datetimes are
+    immutable, so sharing the parsed object is safe.
+    """
+    if _ciso8601 is not None:
+        return _ciso8601.parse_datetime(stamp)
+    return datetime.datetime(
+        int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]),
+        int(stamp[11:13]), int(stamp[14:16]))
+
+
+class DataRow:
+    """A single data point from a standard NOAA data product.
+
+    The flags column is packed into a single integer bitmask at
+    construction so that a row holds five scalar slots instead of a
+    tuple plus a per-row list; the `flags` property unpacks the mask
+    back into a list on demand.
+    """
+    __slots__ = ('time', 'value', 'stdev', 'quality', '_flags',
+                 '_flag_count')
+
+    def __init__(self, moment: datetime.datetime, value: float, stdev: float,
+                 flags: List[bool], quality: str):
+        self.time = moment
+        self.value = value
+        self.stdev = stdev
+        self.quality = quality
+        mask = 0
+        for i, flag in enumerate(flags):
+            if flag:
+                mask |= 1 << i
+        self._flags = mask
+        self._flag_count = len(flags)
+
+    @property
+    def flags(self) -> List[bool]:
+        """The data flags, unpacked from the bitmask into a list."""
+        return [bool(self._flags >> i & 1) for i in range(self._flag_count)]
+
+    def __repr__(self):
+        return (f'DataRow(time={self.time!r}, value={self.value!r}, '
+                f'stdev={self.stdev!r}, flags={self.flags!r}, '
+                f'quality={self.quality!r})')
 
 
 class DataResult:
-    """An immutable wrapper for a list of DataRow objects."""
-    _DATE_FORMAT = '%Y-%m-%d %H:%M'
+    """An immutable wrapper for a list of DataRow objects.
+
+    When numpy is available, rows are held as one column per field
+    (struct-of-arrays) so that bulk conversion happens in C, and DataRow
+    objects are only materialized on access. Without numpy the raw rows
+    are kept as-is and decoded lazily on access, with decoded rows
+    memoized.
+    """
+    __slots__ = ('_raw', '_cache', '_time', '_value', '_stdev', '_flags',
+                 '_quality')
 
     def __init__(self, data):
-        self._rows = []
-        for row in data:
-            time = datetime.datetime.strptime(
-                row['t'],
-                DataResult._DATE_FORMAT)
-            value = float(row['v'])
-            stdev = float(row['s'])
-            flags = [int(x) == 1 for x in row['f'].split(',')]
-            quality = row['q']
-            self._rows.append(DataRow(time, value, stdev, flags, quality))
+        if _np is None:
+            self._raw = data if isinstance(data, list) else list(data)
+            self._cache = {}
+            return
+        data = data if isinstance(data, list) else list(data)
+        count = len(data)
+        self._time = _np.array([row['t'] for row in data],
+                               dtype='datetime64[m]')
+        self._value = _np.fromiter((row['v'] for row in data),
+                                   dtype=_np.float64, count=count)
+        self._stdev = _np.fromiter((row['s'] for row in data),
+                                   dtype=_np.float64, count=count)
+        if data:
+            width = data[0]['f'].count(',') + 1
+            blob = ''.join(row['f'].replace(',', '') for row in data)
+            self._flags = (_np.frombuffer(blob.encode('ascii'),
+                                          dtype=_np.uint8)
+                           != ord('0')).reshape(count, width)
+        else:
+            self._flags = _np.zeros((0, 0), dtype=bool)
+        self._quality = [row['q'] for row in data]
+
+    @staticmethod
+    def _decode(row) -> DataRow:
+        """Decode one raw response row into a DataRow."""
+        moment = _parse_noaa_ts(row['t'])
+        value = float(row['v'])
+        stdev = float(row['s'])
+        raw_flags = row['f']
+        if len(raw_flags) == 7:
+            # The usual '0,0,0,0'-style field: the digits sit at
+            # fixed offsets, so skip the split and int() parses.
+            flags = [raw_flags[0] == '1', raw_flags[2] == '1',
+                     raw_flags[4] == '1', raw_flags[6] == '1']
+        else:
+            flags = [x == '1' for x in raw_flags.split(',')]
+        return DataRow(moment, value, stdev, flags, row['q'])
+
+    @classmethod
+    def _merge(cls, results: List['DataResult']) -> 'DataResult':
+        """Concatenate several results into one, preserving order."""
+        # pylint: disable=protected-access
+        first = results[0]
+        if len(results) == 1:
+            return first
+        merged = cls.__new__(cls)
+        if _np is None:
+            merged._raw = [row for result in results
+                           for row in result._raw]
+            merged._cache = {}
+            return merged
+        merged._time = _np.concatenate(
+            [result._time for result in results])
+        merged._value = _np.concatenate(
+            [result._value for result in results])
+        merged._stdev = _np.concatenate(
+            [result._stdev for result in results])
+        flags = [result._flags for result in results if result._flags.size]
+        merged._flags = _np.concatenate(flags) if flags else first._flags
+        merged._quality = [quality for result in results
+                           for quality in result._quality]
+        return merged
+
+    @property
+    def times(self):
+        """The timestamp column, as a datetime64 array under numpy."""
+        if _np is None:
+            return [row.time for row in self]
+        return self._time
+
+    @property
+    def values(self):
+        """The value column, as a float64 array under numpy."""
+        if _np is None:
+            return [row.value for row in self]
+        return self._value
+
+    def to_dataframe(self):
+        """Return this result as a pandas DataFrame.
+
+        Requires the optional pandas dependency. Under numpy the frame
+        is assembled straight from the columnar arrays, so no per-row
+        decode happens; the fallback path decodes each row once.
+
+        Raises:
+            ImportError: if pandas is not installed.
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            import pandas
+        except ImportError as exc:
+            raise ImportError(
+                'DataResult.to_dataframe() requires pandas') from exc
+        if _np is None:
+            rows = list(self)
+            return pandas.DataFrame({
+                'time': [row.time for row in rows],
+                'value': [row.value for row in rows],
+                'stdev': [row.stdev for row in rows],
+                'quality': [row.quality for row in rows],
+            })
+        return pandas.DataFrame({
+            'time': self._time,
+            'value': self._value,
+            'stdev': self._stdev,
+            'quality': self._quality,
+        })
 
     def __iter__(self):
-        for row in self._rows:
-            yield row
+        if _np is None:
+            # Full scans are the hot interpreted loop, so bind the
+            # decode function and cache once instead of re-resolving
+            # attributes through __getitem__ for every row.
+            decode = DataResult._decode
+            cache = self._cache
+            for i, raw in enumerate(self._raw):
+                row = cache.get(i)
+                if row is None:
+                    row = decode(raw)
+                    cache[i] = row
+                yield row
+            return
+        for i in range(len(self)):
+            yield self[i]
 
     def __getitem__(self, item: int) -> DataRow:
-        return self._rows[item]
+        if _np is None:
+            try:
+                return self._cache[item]
+            except KeyError:
+                row = DataResult._decode(self._raw[item])
+                self._cache[item] = row
+                return row
+        return DataRow(
+            self._time[item].tolist(),
+            self._value[item].item(),
+            self._stdev[item].item(),
+            self._flags[item],
+            self._quality[item])
 
     def __len__(self):
-        return len(self._rows)
+        if _np is None:
+            return len(self._raw)
+        return len(self._quality)
 
 
 class PredictionsRow(typing.NamedTuple):
@@ -160,34 +494,157 @@ class PredictionsRow(typing.NamedTuple):
 
 
 class PredictionsResult:
-    """An immutable wrapper for a list of PredictionsRow objects."""
-    _DATE_FORMAT = '%Y-%m-%d %H:%M'
+    """An immutable wrapper for a list of PredictionsRow objects.
+
+    When numpy is available, rows are held as one column per field
+    (struct-of-arrays), mirroring DataResult, and PredictionsRow
+    objects are only materialized on access. Without numpy the raw
+    rows are kept as-is and decoded lazily on access, with decoded
+    rows memoized.
+    """
+    __slots__ = ('_raw', '_cache', '_time', '_value', '_type')
 
     def __init__(self, data):
-        self._rows = []
-        for row in data:
-            time = datetime.datetime.strptime(
-                row['t'],
-                PredictionsResult._DATE_FORMAT)
-            value = float(row['v'])
-            row_type = row['type'] if 'type' in row else None
-            self._rows.append(PredictionsRow(time, value, row_type))
+        if _np is None:
+            self._raw = data if isinstance(data, list) else list(data)
+            self._cache = {}
+            return
+        data = data if isinstance(data, list) else list(data)
+        count = len(data)
+        self._time = _np.array([row['t'] for row in data],
+                               dtype='datetime64[m]')
+        self._value = _np.fromiter((row['v'] for row in data),
+                                   dtype=_np.float64, count=count)
+        self._type = [row.get('type') for row in data]
+
+    @staticmethod
+    def _decode(row) -> PredictionsRow:
+        """Decode one raw response row into a PredictionsRow."""
+        return PredictionsRow(
+            _parse_noaa_ts(row['t']), float(row['v']), row.get('type'))
+
+    @classmethod
+    def _merge(cls, results: List['PredictionsResult'],
+               ) -> 'PredictionsResult':
+        """Concatenate several results into one, preserving order."""
+        # pylint: disable=protected-access
+        if len(results) == 1:
+            return results[0]
+        merged = cls.__new__(cls)
+        if _np is None:
+            merged._raw = [row for result in results
+                           for row in result._raw]
+            merged._cache = {}
+            return merged
+        merged._time = _np.concatenate(
+            [result._time for result in results])
+        merged._value = _np.concatenate(
+            [result._value for result in results])
+        merged._type = [row_type for result in results
+                        for row_type in result._type]
+        return merged
+
+    @property
+    def times(self):
+        """The timestamp column, as a datetime64 array under numpy."""
+        if _np is None:
+            return [row.time for row in self]
+        return self._time
+
+    @property
+    def values(self):
+        """The value column, as a float64 array under numpy."""
+        if _np is None:
+            return [row.value for row in self]
+        return self._value
+
+    def to_dataframe(self):
+        """Return this result as a pandas DataFrame.
+
+        Requires the optional pandas dependency. Under numpy the frame
+        is assembled straight from the columnar arrays, so no per-row
+        decode happens; the fallback path decodes each row once.
+
+        Raises:
+            ImportError: if pandas is not installed.
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            import pandas
+        except ImportError as exc:
+            raise ImportError(
+                'PredictionsResult.to_dataframe() requires pandas') from exc
+        if _np is None:
+            rows = list(self)
+            return pandas.DataFrame({
+                'time': [row.time for row in rows],
+                'value': [row.value for row in rows],
+                'type': [row.type for row in rows],
+            })
+        return pandas.DataFrame({
+            'time': self._time,
+            'value': self._value,
+            'type': self._type,
+        })
 
     def __iter__(self):
-        for row in self._rows:
-            yield row
+        if _np is None:
+            decode = PredictionsResult._decode
+            cache = self._cache
+            for i, raw in enumerate(self._raw):
+                row = cache.get(i)
+                if row is None:
+                    row = decode(raw)
+                    cache[i] = row
+                yield row
+            return
+        for i in range(len(self)):
+            yield self[i]
 
     def __getitem__(self, item: int) -> PredictionsRow:
-        return self._rows[item]
+        if _np is None:
+            try:
+                return self._cache[item]
+            except KeyError:
+                row = PredictionsResult._decode(self._raw[item])
+                self._cache[item] = row
+                return row
+        return PredictionsRow(
+            self._time[item].tolist(),
+            self._value[item].item(),
+            self._type[item])
 
     def __len__(self):
-        return len(self._rows)
+        if _np is None:
+            return len(self._raw)
+        return len(self._type)
 
 
-class NoaaRequest:
+class NoaaRequest:  # pylint: disable=too-many-instance-attributes
     """Builder for a request against the NOAA Tides and Currents API."""
-    URL_FORMAT = 'https://tidesandcurrents.noaa.gov/api/datagetter?' \
-                 '&application=noaa_py&format=json&{}'
+    __slots__ = ('_time_range', '_product', '_datum', '_units', '_station',
+                 '_interval', '_timezone', '_ready_ok', '_url_cache',
+                 '_refresh_interval', '_refresh_thread', '_refresh_stop',
+                 '_last_result', '_last_ts')
+
+    URL_FORMAT = 'https://tidesandcurrents.noaa.gov/api/datagetter?{}'
+
+    #: Required fields, their validators, and the error raised when a
+    #: field fails validation, checked in order by `_ready()`.
+    _REQUIRED = (
+        ('_time_range', lambda v: v.is_valid(),
+         'Invalid time range specification.'),
+        ('_product', lambda v: isinstance(v, Product),
+         'Invalid or absent NOAA Product.'),
+        ('_datum', lambda v: isinstance(v, Datum),
+         'Invalid or absent NOAA Datum.'),
+        ('_units', lambda v: isinstance(v, Unit),
+         'Invalid or absent Unit specification.'),
+        ('_timezone', lambda v: isinstance(v, TimeZone),
+         'Invalid or absent Timezone.'),
+        ('_station', bool,
+         'Absent Station ID.'),
+    )
 
     def __init__(self):
         self._time_range = NoaaTimeRange()
@@ -197,10 +654,31 @@ class NoaaRequest:
         self._station: int = None
         self._interval: Optional[Interval] = None
         self._timezone: TimeZone = None
-
-    def execute(self) -> Union['PredictionsResult', 'DataResult']:
+        self._ready_ok = False
+        self._url_cache: Optional[str] = None
+        self._refresh_interval: float = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop: Optional[threading.Event] = None
+        self._last_result = None
+        self._last_ts: float = 0.0
+
+    def execute(self, cache_ttl: Optional[float] = 0,
+                ) -> Union['PredictionsResult', 'DataResult']:
         """Executes the built request.
 
+        Args:
+            cache_ttl: If greater than zero, serve a previously fetched
+                result for this URL if it is younger than this many
+                seconds, and cache the result of this call for later
+                executions. Results are immutable, so sharing is safe.
+                If None, a lifetime is chosen from the time range:
+                named dates (today/latest/recent) track a moving
+                window and get 60 seconds, ranges that ended more than
+                a week ago are immutable on the server and never
+                expire, and everything else gets an hour. Caching is
+                off by default because LATEST/RECENT queries would
+                otherwise silently return stale data.
+
         Returns:
             NoaaResult containing the data returned, if successful.
 
@@ -211,14 +689,225 @@ class NoaaRequest:
                 error.
         """
         self._ready(error=True)
-        data = requests.get(str(self)).json()
+        if (self._last_result is not None
+                and time.monotonic() - self._last_ts
+                < self._refresh_interval):
+            return self._last_result
+        if cache_ttl is None:
+            cache_ttl = self._cache_ttl()
+        url = str(self)
+        if cache_ttl > 0:
+            cached = _cache_lookup(url, cache_ttl)
+            if cached is not None:
+                return cached
+        result = self._fetch(url)
+        if cache_ttl > 0:
+            _cache_store(url, result)
+        return result
+
+    def _fetch(self, url: str) -> Union['PredictionsResult', 'DataResult']:
+        """Fetch and decode `url` without consulting any cache."""
+        resp = _get_session().get(url, timeout=_TIMEOUT, stream=True)
+        if (_ijson is not None
+                and int(resp.headers.get('Content-Length') or 0)
+                > _STREAM_THRESHOLD):
+            # Error payloads are tiny, so a body this large is data.
+            # Stream rows out of the response instead of materializing
+            # the whole JSON tree next to the raw bytes.
+            resp.raw.decode_content = True
+            if self._product == Product.PREDICTIONS:
+                return PredictionsResult(
+                    _ijson.items(resp.raw, 'predictions.item'))
+            return DataResult(_ijson.items(resp.raw, 'data.item'))
+        data = _loads(resp.content)
         if 'error' in data:
             raise ApiError(data['error']['message'])
-
         if self._product == Product.PREDICTIONS:
             return PredictionsResult(data['predictions'])
         return DataResult(data['data'])
 
+    def enable_background_refresh(self, interval: float = 60,
+                                  ) -> 'NoaaRequest':
+        """Keep this request's result warm off the critical path.
+
+        Fetches once now, then re-fetches from a daemon thread every
+        `interval` seconds; while the latest background result is
+        younger than `interval`, `execute()` returns it without
+        touching the network. Suits dashboards polling LATEST/RECENT,
+        where the caller should never wait out a round trip. Mutating
+        the request through a builder setter discards the warm result
+        until the next refresh; `disable_background_refresh()` stops
+        the polling entirely.
+
+        Args:
+            interval: Seconds between background re-fetches.
+
+        Returns:
+            The NoaaRequest object it is called on, for chaining.
+
+        Raises:
+            ApiError: if the request is malformed or the priming fetch
+                fails.
+        """
+        self._ready(error=True)
+        self._refresh_interval = interval
+        if self._refresh_thread is None:
+            self._last_result = self._fetch(str(self))
+            self._last_ts = time.monotonic()
+            self._refresh_stop = threading.Event()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, daemon=True)
+            self._refresh_thread.start()
+        return self
+
+    def disable_background_refresh(self) -> None:
+        """Stop the background refresh thread, if one is running.
+
+        The warm result is discarded, so the next `execute()` fetches
+        normally. A stopped request can be re-enabled later.
+        """
+        if self._refresh_thread is None:
+            return
+        self._refresh_stop.set()
+        self._refresh_thread.join()
+        self._refresh_thread = None
+        self._refresh_stop = None
+        self._refresh_interval = 0.0
+        self._last_result = None
+
+    def _refresh_loop(self) -> None:
+        """Body of the background refresh thread."""
+        while not self._refresh_stop.wait(self._refresh_interval):
+            try:
+                self._last_result = self._fetch(str(self))
+                self._last_ts = time.monotonic()
+            except Exception:  # pylint: disable=W0703
+                # Keep serving the last good result; the next tick
+                # tries again.
+                pass
+
+    def _cache_ttl(self) -> float:
+        """Choose a cache lifetime from this request's time range.
+
+        Named dates follow a moving window, so they go stale quickly;
+        historical data that ended over a week ago is immutable on the
+        server; anything else may still gain late quality-controlled
+        revisions.
+        """
+        time_range = self._time_range
+        if time_range.date is not None:
+            return 60.0
+        week_ago = datetime.datetime.now() - datetime.timedelta(days=7)
+        if time_range.end is not None and time_range.end < week_ago:
+            return float('inf')
+        return 3600.0
+
+    def execute_iter(self) -> typing.Iterator[
+            Union['PredictionsRow', 'DataRow']]:
+        """Executes the built request, yielding rows as they decode.
+
+        Unlike `execute()`, no result object is materialized: rows
+        stream out one at a time, so peak memory stays flat for very
+        large ranges and downstream filtering can start before the
+        response finishes parsing. Large responses are decoded
+        incrementally when ijson is installed, exactly as in
+        `execute()`.
+
+        Yields:
+            PredictionsRow or DataRow objects, depending on the
+            product, in response order.
+
+        Raises:
+            ApiError: as for `execute()`.
+        """
+        self._ready(error=True)
+        resp = _get_session().get(str(self), timeout=_TIMEOUT, stream=True)
+        # pylint: disable=protected-access
+        if self._product == Product.PREDICTIONS:
+            decode, key = PredictionsResult._decode, 'predictions'
+        else:
+            decode, key = DataResult._decode, 'data'
+        if (_ijson is not None
+                and int(resp.headers.get('Content-Length') or 0)
+                > _STREAM_THRESHOLD):
+            resp.raw.decode_content = True
+            for raw in _ijson.items(resp.raw, key + '.item'):
+                yield decode(raw)
+            return
+        data = _loads(resp.content)
+        if 'error' in data:
+            raise ApiError(data['error']['message'])
+        for raw in data[key]:
+            yield decode(raw)
+
+    def execute_split(self, max_days: int = 31, max_workers: int = 8,
+                      ) -> Union['PredictionsResult', 'DataResult']:
+        """Execute a long explicit range as parallel sub-requests.
+
+        NOAA caps high-resolution products at 31 days per response, so
+        a long range must be fetched in windows. This splits
+        [begin, end] into windows of at most `max_days`, executes them
+        concurrently through `execute_many`, and merges the rows back
+        into a single result in time order. Successive windows start
+        one minute after the previous one ends, so the inclusive
+        endpoints never double-count a sample, and the final window
+        absorbs any remainder smaller than a full window so the end of
+        the range is never dropped.
+
+        Args:
+            max_days: The largest window to request at once.
+            max_workers: The maximum number of windows in flight at
+                once.
+
+        Returns:
+            One merged result covering the full range.
+
+        Raises:
+            ApiError: if the request lacks explicit begin and end
+                dates, is otherwise malformed, or any window fails.
+        """
+        begin = self._time_range.begin
+        end = self._time_range.end
+        if begin is None or end is None:
+            raise ApiError(
+                'execute_split() requires explicit begin and end dates.')
+        self._ready(error=True)
+        step = datetime.timedelta(days=max_days)
+        minute = datetime.timedelta(minutes=1)
+        windows = []
+        cursor = begin
+        # Stop carving while more than one window remains: carving up
+        # to the very end would leave a tail of less than one minute
+        # as a degenerate [end, end] window, silently dropping the
+        # final sample. The last window runs at most one minute over
+        # `step` to absorb that remainder.
+        while end - cursor > step + minute:
+            window_end = cursor + step
+            windows.append((cursor, window_end))
+            cursor = window_end + minute
+        windows.append((cursor, end))
+        clones = [self._clone_window(b, e) for b, e in windows]
+        results = execute_many(clones, max_workers)
+        for result in results:
+            if isinstance(result, ApiError):
+                raise result
+        return _merge_results(results)
+
+    def _clone_window(self, begin: datetime.datetime,
+                      end: datetime.datetime) -> 'NoaaRequest':
+        """Copy this request with a different explicit time window."""
+        clone = (NoaaRequest()
+                 .product(self._product)
+                 .datum(self._datum)
+                 .units(self._units)
+                 .timezone(self._timezone)
+                 .station(self._station)
+                 .begin_date(begin)
+                 .end_date(end))
+        if self._interval:
+            clone.interval(self._interval)
+        return clone
+
     def begin_date(self, begin: datetime.datetime) -> 'NoaaRequest':
         """Set the beginning date for the result.
 
@@ -233,6 +922,7 @@ class NoaaRequest:
             The NoaaRequest object it was called on, for chaining.
 
         """
+        self._invalidate()
         self._time_range.begin = begin
         return self
 
@@ -250,6 +940,7 @@ class NoaaRequest:
             The NoaaRequest object it was called on, for chaining.
 
         """
+        self._invalidate()
         self._time_range.end = end
         return self
 
@@ -270,6 +961,7 @@ class NoaaRequest:
             The NoaaRequest object it is called on, for chaining.
 
         """
+        self._invalidate()
         self._time_range.hours = hours
         return self
 
@@ -291,10 +983,11 @@ class NoaaRequest:
 
         See Also: NoaaDate
         """
+        self._invalidate()
         if isinstance(date, NoaaDate):
             self._time_range.date = date
         else:
-            self._time_range.date = NoaaDate(date)
+            self._time_range.date = _to_member(_NOAA_DATES, date, NoaaDate)
         return self
 
     def product(self, product: Union[Product, str]) -> 'NoaaRequest':
@@ -309,10 +1002,11 @@ class NoaaRequest:
 
         See Also: NoaaProduct
         """
+        self._invalidate()
         if isinstance(product, Product):
             self._product = product
         else:
-            self._product = Product(product)
+            self._product = _to_member(_PRODUCTS, product, Product)
         return self
 
     def datum(self, datum: Union[Datum, str]) -> 'NoaaRequest':
@@ -328,10 +1022,11 @@ class NoaaRequest:
         Returns:
             The NoaaRequest object it is called on, for chaining.
         """
+        self._invalidate()
         if isinstance(datum, Datum):
             self._datum = datum
         else:
-            self._datum = Datum(datum)
+            self._datum = _to_member(_DATUMS, datum, Datum)
         return self
 
     def units(self, units: Union[Unit, str]) -> 'NoaaRequest':
@@ -351,22 +1046,29 @@ class NoaaRequest:
         See Also:
             tides.Unit
         """
+        self._invalidate()
         if isinstance(units, Unit):
             self._units = units
         else:
-            self._units = Unit(units)
+            self._units = _to_member(_UNITS, units, Unit)
         return self
 
     def station(self, station_id: int) -> 'NoaaRequest':
         """Specify ID of the station to be queried.
 
         Args:
-            station_id: A station ID.
+            station_id: A station ID, as an integer or a string of
+                digits.
 
         Returns:
             The NoaaRequest object it is called on, for chaining.
+
+        Raises:
+            ValueError: if `station_id` does not parse as an integer,
+                so a typo fails here rather than at execute time.
         """
-        self._station = station_id
+        self._invalidate()
+        self._station = int(station_id)
         return self
 
     def interval(self, interval: Union[Interval, str]) -> 'NoaaRequest':
@@ -384,10 +1086,11 @@ class NoaaRequest:
         Returns:
             The NoaaRequest object it is called on, for chaining.
         """
+        self._invalidate()
         if isinstance(interval, Interval):
             self._interval = interval
         else:
-            self._interval = Interval(interval)
+            self._interval = _to_member(_INTERVALS, interval, Interval)
         return self
 
     def timezone(self, timezone: Union[TimeZone, str]) -> 'NoaaRequest':
@@ -404,25 +1107,129 @@ class NoaaRequest:
         Returns:
             The NoaaRequest object it is called on, for chaining.
         """
+        self._invalidate()
         if isinstance(timezone, TimeZone):
             self._timezone = timezone
         else:
-            self._timezone = TimeZone(timezone)
+            self._timezone = _to_member(_TIMEZONES, timezone, TimeZone)
         return self
 
-    def __str__(self) -> str:
-        """Return the URL associated with this request."""
-        interval = self._interval.value if self._interval else ''
-        args = '&'.join([
-            str(self._time_range),
-            'product=' + self._product.value,
-            'datum=' + self._datum.value,
-            'units=' + self._units.value,
-            'time_zone=' + self._timezone.value,
-            'interval=' + interval,
-            'station=' + str(self._station),
+    def freeze(self) -> typing.Callable[
+            [datetime.datetime, datetime.datetime], str]:
+        """Specialize URL construction over a (begin, end) window.
+
+        Captures every non-time parameter of this request into a
+        prebuilt template, so callers sweeping many date windows pay
+        two timestamp formats per URL instead of a full rebuild:
+
+            url_for = req.freeze()
+            urls = [url_for(b, e) for b, e in windows]
+
+        The returned callable is independent of this builder; later
+        setter calls do not affect it.
+
+        Raises:
+            ApiError: if any non-time required parameter is unset or
+                invalid.
+        """
+        for attr, check, message in NoaaRequest._REQUIRED:
+            if attr == '_time_range':
+                continue
+            if not check(getattr(self, attr)):
+                raise ApiError(message)
+        head = urllib.parse.urlencode([
+            ('application', 'noaa_py'),
+            ('format', 'json'),
         ])
-        return NoaaRequest.URL_FORMAT.format(args)
+        tail_params = [
+            _PRODUCT_PAIR[self._product],
+            _DATUM_PAIR[self._datum],
+            _UNIT_PAIR[self._units],
+            _TIMEZONE_PAIR[self._timezone],
+        ]
+        if self._interval:
+            tail_params.append(_INTERVAL_PAIR[self._interval])
+        tail_params.append(('station', str(self._station)))
+        template = NoaaRequest.URL_FORMAT.format(
+            head + '&begin_date={}&end_date={}&'
+            + urllib.parse.urlencode(tail_params))
+        quote = urllib.parse.quote_plus
+        fmt = _format_noaa_ts
+        return lambda begin, end: template.format(
+            quote(fmt(begin)), quote(fmt(end)))
+
+    def compile_template(self, *varying: str) -> typing.Callable[..., str]:
+        """Bake the current parameters into a URL template.
+
+        Every parameter not named in `varying` is rendered and escaped
+        now; the returned callable fills in the varying ones by
+        keyword, so a sweep over e.g. station IDs pays one format call
+        per URL:
+
+            build = req.compile_template('station')
+            urls = [build(station=s) for s in stations]
+
+        Varying fields need not be set on the builder; fixed fields
+        that are unset are simply omitted, as in the regular builder.
+        The returned callable is independent of later setter calls.
+
+        Args:
+            varying: Query parameter names to leave open, e.g.
+                'station', 'datum', 'begin_date'.
+        """
+        varying_set = frozenset(varying)
+        quote = urllib.parse.quote_plus
+        fixed = dict(self._time_range.as_pairs())
+        fixed['product'] = self._product.value if self._product else None
+        fixed['datum'] = self._datum.value if self._datum else None
+        fixed['units'] = self._units.value if self._units else None
+        fixed['time_zone'] = self._timezone.value if self._timezone else None
+        fixed['interval'] = self._interval.value if self._interval else None
+        fixed['station'] = str(self._station) if self._station else None
+        parts = ['application=noaa_py', 'format=json']
+        for key in ('begin_date', 'end_date', 'range', 'date', 'product',
+                    'datum', 'units', 'time_zone', 'interval', 'station'):
+            if key in varying_set:
+                parts.append(key + '={' + key + '}')
+            elif fixed.get(key) is not None:
+                parts.append(key + '=' + quote(fixed[key]))
+        template = NoaaRequest.URL_FORMAT.format('&'.join(parts))
+
+        def build(**fields) -> str:
+            return template.format(**{
+                key: quote(value if isinstance(value, str) else str(value))
+                for key, value in fields.items()})
+        return build
+
+    def _invalidate(self) -> None:
+        """Discard cached state after a builder setter mutates the request."""
+        self._ready_ok = False
+        self._url_cache = None
+        self._last_result = None
+
+    def __str__(self) -> str:
+        """Return the URL associated with this request.
+
+        The built URL is cached until the next builder-setter call, so
+        repeatedly executing an unchanged request only formats it once.
+        """
+        if self._url_cache is not None:
+            return self._url_cache
+        params = [
+            ('application', 'noaa_py'),
+            ('format', 'json'),
+        ]
+        params.extend(self._time_range.as_pairs())
+        params.append(_PRODUCT_PAIR[self._product])
+        params.append(_DATUM_PAIR[self._datum])
+        params.append(_UNIT_PAIR[self._units])
+        params.append(_TIMEZONE_PAIR[self._timezone])
+        if self._interval:
+            params.append(_INTERVAL_PAIR[self._interval])
+        params.append(('station', str(self._station)))
+        self._url_cache = NoaaRequest.URL_FORMAT.format(
+            urllib.parse.urlencode(params))
+        return self._url_cache
 
     def _ready(self, error=False) -> bool:
         """Check if the request is ready to be executed.
@@ -441,33 +1248,15 @@ class NoaaRequest:
         Raises:
             If `error` is True, may raise MalformedRequestException.
         """
-        res = True
-        if not self._time_range.is_valid():
-            res = False
-            if error:
-                raise ApiError('Invalid time range specification.')
-        if not isinstance(self._product, Product):
-            res = False
-            if error:
-                raise ApiError('Invalid or absent NOAA Product.')
-        if not isinstance(self._datum, Datum):
-            res = False
-            if error:
-                raise ApiError('Invalid or absent NOAA Datum.')
-        if not isinstance(self._units, Unit):
-            res = False
-            if error:
-                raise ApiError('Invalid or absent Unit specification.')
-        if not isinstance(self._timezone, TimeZone):
-            res = False
-            if error:
-                raise ApiError('Invalid or absent Timezone.')
-        if not self._station:
-            res = False
-            if error:
-                raise ApiError('Absent Station ID.')
-
-        return res
+        if self._ready_ok:
+            return True
+        for attr, check, message in NoaaRequest._REQUIRED:
+            if not check(getattr(self, attr)):
+                if error:
+                    raise ApiError(message)
+                return False
+        self._ready_ok = True
+        return True
 
 
 class NoaaTimeRange:
@@ -478,7 +1267,18 @@ class NoaaTimeRange:
     time string results.
 
     """
-    _FORMAT_STRING = '%Y%m%d %H:%M'
+    __slots__ = ('_begin', '_begin_str', '_end', '_end_str', 'hours',
+                 'date')
+
+    #: The valid combinations of (begin, end, hours, date) presence,
+    #: mapped to the check that the populated fields must still pass.
+    _VALID_SIGNATURES = {
+        (True, True, False, False): lambda s: s.begin < s.end,
+        (True, False, True, False): lambda s: s.hours > 0,
+        (False, True, True, False): lambda s: s.hours > 0,
+        (False, False, True, False): lambda s: s.hours > 0,
+        (False, False, False, True): lambda s: isinstance(s.date, NoaaDate),
+    }
 
     def __init__(self):
         self.begin: datetime.datetime = None
@@ -486,6 +1286,28 @@ class NoaaTimeRange:
         self.hours: int = None
         self.date: NoaaDate = None
 
+    @property
+    def begin(self) -> datetime.datetime:
+        """The beginning of the range, as assigned."""
+        return self._begin
+
+    @begin.setter
+    def begin(self, value: datetime.datetime) -> None:
+        # Format at assignment so repeated serializations of the same
+        # range (logging, retries, batch fanout) skip the formatter.
+        self._begin = value
+        self._begin_str = _format_noaa_ts(value) if value else None
+
+    @property
+    def end(self) -> datetime.datetime:
+        """The end of the range, as assigned."""
+        return self._end
+
+    @end.setter
+    def end(self, value: datetime.datetime) -> None:
+        self._end = value
+        self._end_str = _format_noaa_ts(value) if value else None
+
     def is_valid(self) -> bool:
         """Checks if this is a well-formed range for NOAA's API.
 
@@ -504,43 +1326,65 @@ class NoaaTimeRange:
             False otherwise.
 
         """
-        # Beginning and an end:
-        if self.begin and self.end and not (self.hours or self.date):
-            return self.begin < self.end
-
-        # Endpoint and duration:
-        if self.begin and self.hours and not (self.end or self.date):
-            return self.hours > 0
-        if self.end and self.hours and not (self.begin or self.date):
-            return self.hours > 0
-
-        # Duration and implicit endpoint:
-        if self.hours and not (self.begin or self.end or self.date):
-            return self.hours > 0
-
-        # Date constant from enum
-        if self.date and not (self.begin or self.end or self.hours):
-            return isinstance(self.date, NoaaDate)
-
-        return False
+        signature = (self.begin is not None, self.end is not None,
+                     self.hours is not None, self.date is not None)
+        check = NoaaTimeRange._VALID_SIGNATURES.get(signature)
+        return check(self) if check else False
+
+    def as_pairs(self) -> List[typing.Tuple[str, str]]:
+        """Ordered (key, value) pairs for this time range."""
+        pairs = []
+        if self._begin_str:
+            pairs.append(('begin_date', self._begin_str))
+        if self._end_str:
+            pairs.append(('end_date', self._end_str))
+        if self.hours:
+            pairs.append(('range', str(self.hours)))
+        if self.date:
+            pairs.append(('date', self.date.value))
+        return pairs
 
     def as_dict(self) -> Mapping[str, str]:
         """Dictionary for this time range."""
-        res = dict()
-        if self.begin:
-            res['begin_date'] = self.begin.strftime(
-                NoaaTimeRange._FORMAT_STRING)
-        if self.end:
-            res['end_date'] = self.end.strftime(
-                NoaaTimeRange._FORMAT_STRING)
-        if self.hours:
-            res['range'] = str(self.hours)
-        if self.date:
-            res['date'] = self.date.value
-        return res
+        return dict(self.as_pairs())
 
     def __str__(self) -> str:
         """URL-encoded string representing this time range."""
-        return '&'.join(map(
-            lambda x: '{}={}'.format(*x),
-            self.as_dict().items()))
+        return urllib.parse.urlencode(self.as_pairs())
+
+
+def _merge_results(results):
+    """Concatenate same-product results into one, preserving order."""
+    return type(results[0])._merge(results)  # pylint: disable=protected-access
+
+
+def execute_many(requests_: List['NoaaRequest'],
+                 max_workers: int = 8,
+                 ) -> List[Union['PredictionsResult', 'DataResult']]:
+    """Execute several requests concurrently.
+
+    The requests share the module's pooled session, so up to
+    `max_workers` of them are in flight at once over keep-alive
+    connections. NOAA rate-limits aggressive clients, so keep
+    `max_workers` modest when executing large batches.
+
+    Args:
+        requests_: The requests to execute.
+        max_workers: The maximum number of requests in flight at once.
+
+    Returns:
+        The results, in the same order as the requests. A request that
+        fails contributes the ApiError it raised at its slot instead of
+        aborting the batch, so one bad station does not discard the
+        rest of the fetch.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(request.execute)
+                   for request in requests_]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except ApiError as err:
+            results.append(err)
+    return results